@@ -1,14 +1,42 @@
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from .const import DOMAIN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .api import CloudflareAPI
+from .const import CONF_API_TOKEN, CONF_ZONE_ID, COUNTRY_WEB_KEY_PREFIXES, DOMAIN
+from .coordinator import CloudflareCoordinator
 
 PLATFORMS: list[str] = ["sensor"]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Cloudflare Statistics from a config entry."""
+    _async_backfill_unique_id(hass, entry)
+
+    api = CloudflareAPI(
+        async_get_clientsession(hass),
+        entry.data[CONF_ZONE_ID],
+        entry.data[CONF_API_TOKEN],
+    )
+    # Enabling an entity reloads the entry, but disabling one does not, so also follow registry updates
+    api.fetch_country_web = _country_web_sensor_enabled(hass, entry)
+
+    @callback
+    def _async_entity_registry_updated(event: Event) -> None:
+        if event.data["action"] == "update" and "disabled_by" not in event.data.get("changes", {}):
+            return
+        api.fetch_country_web = _country_web_sensor_enabled(hass, entry)
+
+    entry.async_on_unload(
+        hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated)
+    )
+
+    coordinator = CloudflareCoordinator(hass, entry, api)
+    await coordinator.async_config_entry_first_refresh()
+
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
@@ -19,4 +47,28 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+@callback
+def _async_backfill_unique_id(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # Entries created before the config flow set one have no unique_id, so the duplicate check would miss them
+    if entry.unique_id is not None:
+        return
+    zone_id = entry.data[CONF_ZONE_ID]
+    if any(other.unique_id == zone_id for other in hass.config_entries.async_entries(DOMAIN)):
+        return
+    hass.config_entries.async_update_entry(entry, unique_id=zone_id)
+
+
+def _country_web_sensor_enabled(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    prefix = f"cloudflare_{entry.entry_id}_"
+    country_web_entries = [
+        reg_entry
+        for reg_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if reg_entry.unique_id.removeprefix(prefix).startswith(COUNTRY_WEB_KEY_PREFIXES)
+    ]
+    # Sensors that are not registered yet will be created enabled
+    return not country_web_entries or any(
+        reg_entry.disabled_by is None for reg_entry in country_web_entries
+    )
@@ -0,0 +1,451 @@
+import logging
+import sys
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+import aiohttp
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util.json import json_loads
+
+MIN_TIME_BETWEEN_UPDATES = timedelta(seconds=60)
+# Manual refreshes closer together than this reuse the last result; kept a little under
+# MIN_TIME_BETWEEN_UPDATES so scheduler jitter never swallows a regular poll
+MIN_SECONDS_BETWEEN_FETCHES = MIN_TIME_BETWEEN_UPDATES.total_seconds() - 5
+GRAPHQL_URL = "https://api.cloudflare.com/client/v4/graphql"
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=20)
+# Country and web analytics move slowly; reuse them between refreshes of the requests totals
+COUNTRY_WEB_CACHE_TTL = 600
+# GraphQL errors do not tell a plan rejection apart from a transient failure,
+# so a zone whose country/web query failed is probed again after this long
+COUNTRY_WEB_RETRY_INTERVAL = 3600
+_LOGGER = logging.getLogger(__name__)
+
+
+def _to_rfc3339(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+QUERY_REQUESTS = """
+query (
+    $zoneTag: String!,
+    $monthStart: Date!,
+    $todayDate: Date!
+) {
+    viewer {
+        zones(filter: { zoneTag: $zoneTag }) {
+            httpRequests1dGroups(
+                limit: 30
+                orderBy: [date_ASC]
+                filter: { date_geq: $monthStart, date_leq: $todayDate }
+            ) {
+                dimensions { date }
+                sum { requests bytes }
+                uniq { uniques }
+            }
+        }
+    }
+}
+"""
+
+
+# Daily requests plus country and web analytics in a single round trip.
+# Free plans reject the adaptive groups, in which case QUERY_REQUESTS is used.
+QUERY_COMBINED = """
+query (
+    $zoneTag: String!,
+    $monthStart: Date!,
+    $todayDate: Date!,
+    $todayStart: DateTime!,
+    $todayEnd: DateTime!,
+    $weekStart: DateTime!,
+    $monthStartDt: DateTime!
+) {
+    viewer {
+        zones(filter: { zoneTag: $zoneTag }) {
+            httpRequests1dGroups(
+                limit: 30
+                orderBy: [date_ASC]
+                filter: { date_geq: $monthStart, date_leq: $todayDate }
+            ) {
+                dimensions { date }
+                sum { requests bytes }
+                uniq { uniques }
+            }
+
+            countryToday: httpRequestsAdaptiveGroups(
+                limit: 25
+                orderBy: [sum_requests_DESC]
+                filter: { datetime_geq: $todayStart, datetime_leq: $todayEnd }
+            ) {
+                dimensions { clientCountryName }
+                sum { requests }
+            }
+
+            countryWeek: httpRequestsAdaptiveGroups(
+                limit: 25
+                orderBy: [sum_requests_DESC]
+                filter: { datetime_geq: $weekStart, datetime_leq: $todayEnd }
+            ) {
+                dimensions { clientCountryName }
+                sum { requests }
+            }
+
+            countryMonth: httpRequestsAdaptiveGroups(
+                limit: 25
+                orderBy: [sum_requests_DESC]
+                filter: { datetime_geq: $monthStartDt, datetime_leq: $todayEnd }
+            ) {
+                dimensions { clientCountryName }
+                sum { requests }
+            }
+
+            webToday: rumPageloadEventsAdaptiveGroups(
+                limit: 1
+                filter: { datetime_geq: $todayStart, datetime_leq: $todayEnd }
+            ) {
+                avg { pageLoadTime }
+                sum { visits pageViews }
+            }
+
+            webWeek: rumPageloadEventsAdaptiveGroups(
+                limit: 1
+                filter: { datetime_geq: $weekStart, datetime_leq: $todayEnd }
+            ) {
+                avg { pageLoadTime }
+                sum { visits pageViews }
+            }
+
+            webMonth: rumPageloadEventsAdaptiveGroups(
+                limit: 1
+                filter: { datetime_geq: $monthStartDt, datetime_leq: $todayEnd }
+            ) {
+                avg { pageLoadTime }
+                sum { visits pageViews }
+            }
+        }
+    }
+}
+"""
+
+
+def _payload_prefix(query: str) -> bytes:
+    return b'{"query":' + json_bytes(query) + b',"variables":'
+
+
+# The query text never changes, so it is JSON-encoded once at import; only the
+# small variables dict is serialized and appended to these prefixes.
+QUERY_REQUESTS_PREFIX = _payload_prefix(QUERY_REQUESTS)
+QUERY_COMBINED_PREFIX = _payload_prefix(QUERY_COMBINED)
+
+
+def _first_zone(result: Dict[str, Any]) -> Dict[str, Any]:
+    zones = ((result.get("data") or {}).get("viewer") or {}).get("zones") or []
+    return (zones[0] or {}) if zones else {}
+
+
+class CloudflareAPI:
+    __slots__ = (
+        "zone_id",
+        "api_token",
+        "data",
+        "_country_web_supported",
+        "_country_web_retry_at",
+        "fetch_country_web",
+        "_windows_date",
+        "_month_start",
+        "_request_body",
+        "_combined_body",
+        "_country_web_cache",
+        "_last_fetch",
+        "_session",
+        "_headers",
+    )
+
+    def __init__(self, session: aiohttp.ClientSession, zone_id: str, api_token: str):
+        self.zone_id = zone_id
+        self.api_token = api_token
+        self.data: Dict[str, Any] = {}
+        self._country_web_supported = True
+        self._country_web_retry_at = 0.0
+        self.fetch_country_web = True
+
+        # GraphQL variables only change at UTC midnight, so the encoded bodies are built once per day
+        self._windows_date: Optional[date] = None
+        self._month_start: Optional[datetime] = None
+        self._request_body = b""
+        self._combined_body = b""
+
+        # (expires_at, parsed country/web data) on the time.monotonic() clock
+        self._country_web_cache: Optional[tuple[float, Dict[str, Any]]] = None
+        self._last_fetch = 0.0
+
+        # Home Assistant's shared session keeps the HTTPS connection alive between polls
+        self._session = session
+        self._headers = {
+            "Authorization": f"Bearer {api_token}",
+            "Content-Type": "application/json",
+        }
+
+    @property
+    def country_web_supported(self) -> bool:
+        """False while Cloudflare is rejecting the country/web analytics query for this zone."""
+        return self._country_web_supported
+
+    async def async_fetch(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if self.data and now - self._last_fetch < MIN_SECONDS_BETWEEN_FETCHES:
+            return self.data
+
+        data = await self._async_fetch()
+        self._last_fetch = now
+        return data
+
+    async def _async_fetch(self) -> Dict[str, Any]:
+        self.data = {}
+
+        today_date = datetime.now(timezone.utc).date()
+        if today_date != self._windows_date:
+            self._update_windows(today_date)
+        month_start = self._month_start
+
+        if not self._country_web_supported and time.monotonic() >= self._country_web_retry_at:
+            self._country_web_supported = True
+
+        cache = self._country_web_cache
+        if cache is not None and time.monotonic() < cache[0]:
+            await self._fetch_requests(self._request_body, today_date, month_start)
+            self.data.update(cache[1])
+            return self.data
+
+        if self.country_web_supported and self.fetch_country_web:
+            if await self._fetch_combined(self._combined_body, today_date, month_start):
+                return self.data
+
+        await self._fetch_requests(self._request_body, today_date, month_start)
+        return self.data
+
+    def _disable_country_web(self) -> None:
+        self._country_web_supported = False
+        self._country_web_retry_at = time.monotonic() + COUNTRY_WEB_RETRY_INTERVAL
+
+    def _update_windows(self, today_date: date) -> None:
+        today_start = datetime(today_date.year, today_date.month, today_date.day, tzinfo=timezone.utc)
+        today_end = today_start + timedelta(days=1)
+        week_start = today_start - timedelta(days=6)
+        month_start = today_start - timedelta(days=29)
+
+        self._windows_date = today_date
+        self._month_start = month_start
+        # Cached country/web totals belong to the previous day's windows
+        self._country_web_cache = None
+        request_vars = {
+            "zoneTag": self.zone_id,
+            "monthStart": month_start.date().isoformat(),
+            "todayDate": today_date.isoformat(),
+        }
+        combined_vars = {
+            **request_vars,
+            "todayStart": _to_rfc3339(today_start),
+            "todayEnd": _to_rfc3339(today_end),
+            "weekStart": _to_rfc3339(week_start),
+            "monthStartDt": _to_rfc3339(month_start),
+        }
+        self._request_body = QUERY_REQUESTS_PREFIX + json_bytes(request_vars) + b"}"
+        self._combined_body = QUERY_COMBINED_PREFIX + json_bytes(combined_vars) + b"}"
+
+    async def _post(self, payload: bytes, label: str) -> Dict[str, Any]:
+        try:
+            async with self._session.post(
+                GRAPHQL_URL,
+                headers=self._headers,
+                data=payload,
+                timeout=REQUEST_TIMEOUT,
+            ) as resp:
+                body = await resp.read()
+            result = json_loads(body)
+        except Exception as err:
+            raise UpdateFailed(f"Cloudflare {label} query failed: {err}") from err
+
+        if not isinstance(result, dict):
+            raise UpdateFailed(f"Unexpected Cloudflare response type ({label}): {type(result)}")
+
+        return result
+
+    async def _fetch_combined(
+        self,
+        payload: bytes,
+        today_date: date,
+        month_start: datetime,
+    ) -> bool:
+        """Fetch requests, country and web analytics in one round trip.
+
+        Returns False when Cloudflare rejected the country/web part, so the
+        caller can fall back to the requests-only query.
+        """
+        result = await self._post(payload, "combined")
+
+        if result.get("errors"):
+            _LOGGER.warning("Cloudflare country/web GraphQL errors: %s", result.get("errors"))
+            self._disable_country_web()
+            return False
+
+        if not result.get("data"):
+            _LOGGER.warning("Cloudflare country/web GraphQL returned no data; disabling country/web sensors")
+            self._disable_country_web()
+            return False
+
+        zone = _first_zone(result)
+
+        try:
+            self.data.update(_parse_requests(zone, today_date, month_start))
+        except Exception:
+            _LOGGER.exception("Failed to parse Cloudflare requests response")
+
+        try:
+            country_web = _parse_country(zone)
+            country_web.update(_parse_web_analytics(zone))
+        except Exception:
+            _LOGGER.warning("Failed to parse Cloudflare country/web response; disabling country/web sensors")
+            self._disable_country_web()
+            return True
+
+        self.data.update(country_web)
+        self._country_web_cache = (time.monotonic() + COUNTRY_WEB_CACHE_TTL, country_web)
+        return True
+
+    async def _fetch_requests(
+        self,
+        payload: bytes,
+        today_date: date,
+        month_start: datetime,
+    ) -> None:
+        result = await self._post(payload, "requests")
+
+        if result.get("errors"):
+            raise UpdateFailed(f"Cloudflare requests GraphQL errors: {result.get('errors')}")
+
+        zone = _first_zone(result)
+
+        try:
+            self.data.update(_parse_requests(zone, today_date, month_start))
+        except Exception:
+            _LOGGER.exception("Failed to parse Cloudflare requests response")
+
+
+def _parse_requests(zone: Dict[str, Any], today_date: date, month_start: datetime) -> Dict[str, Any]:
+    groups = zone.get("httpRequests1dGroups") or []
+    if not groups:
+        _LOGGER.debug("No httpRequests1dGroups data returned")
+        return {}
+
+    views_today = views_week = views_month = 0
+    uniques_today = uniques_week = uniques_month = 0
+    bytes_today = bytes_week = bytes_month = 0
+
+    # Window bounds are loop invariants; today and the week are nested inside the month
+    week_start_date = today_date - timedelta(days=6)
+    month_start_date = month_start.date()
+
+    for item in groups:
+        date_str = (item.get("dimensions") or {}).get("date")
+        if not date_str:
+            continue
+        try:
+            bucket_date = date.fromisoformat(date_str)
+        except ValueError:
+            continue
+        if not month_start_date <= bucket_date <= today_date:
+            continue
+
+        sums = item.get("sum") or {}
+        uniques = item.get("uniq") or {}
+
+        req = sums.get("requests") or 0
+        bts = sums.get("bytes") or 0
+        uni = uniques.get("uniques") or 0
+
+        views_month += req
+        uniques_month += uni
+        bytes_month += bts
+        if bucket_date >= week_start_date:
+            views_week += req
+            uniques_week += uni
+            bytes_week += bts
+        if bucket_date == today_date:
+            views_today += req
+            uniques_today += uni
+            bytes_today += bts
+
+    return {
+        "views_today": views_today,
+        "views_week": views_week,
+        "views_month": views_month,
+        "uniques_today": uniques_today,
+        "uniques_week": uniques_week,
+        "uniques_month": uniques_month,
+        "bandwidth_today_bytes": bytes_today,
+        "bandwidth_week_bytes": bytes_week,
+        "bandwidth_month_bytes": bytes_month,
+    }
+
+
+def _parse_country(zone: Dict[str, Any]) -> Dict[str, Any]:
+    alias_map = {
+        "today": "countryToday",
+        "week": "countryWeek",
+        "month": "countryMonth",
+    }
+
+    data: Dict[str, Any] = {}
+    for window, gql_key in alias_map.items():
+        groups = zone.get(gql_key) or []
+        top_requests, attributes = _summarize_countries(groups)
+        data.update({
+            f"country_{window}": top_requests,
+            f"country_{window}_attributes": attributes,
+        })
+    return data
+
+
+def _summarize_countries(groups: list[Dict[str, Any]]) -> tuple[Optional[int], Dict[str, Any]]:
+    country_map: Counter[str] = Counter()
+    for item in groups or []:
+        dims = item.get("dimensions") or {}
+        sums = item.get("sum") or {}
+        # The same few names come back every poll; share one string object per country
+        country = sys.intern(dims.get("clientCountryName") or "Unknown")
+        country_map[country] += sums.get("requests") or 0
+
+    if not country_map:
+        return None, {"top_country": None, "countries": {}}
+
+    # Not simply the first row: null and empty names are merged into "Unknown" above
+    top_country, top_requests = country_map.most_common(1)[0]
+    # Plain dict for the state attributes; Home Assistant serializes it as-is.
+    # Attributes are built once per fetch and reused by every state write until the next one
+    return top_requests, {"top_country": top_country, "countries": dict(country_map)}
+
+
+def _parse_web_analytics(zone: Dict[str, Any]) -> Dict[str, Any]:
+    alias_map = {
+        "today": "webToday",
+        "week": "webWeek",
+        "month": "webMonth",
+    }
+
+    data: Dict[str, Any] = {}
+    for window, gql_key in alias_map.items():
+        # No dimensions are selected, so Cloudflare aggregates the whole window into one row
+        row = (zone.get(gql_key) or [{}])[0] or {}
+        sums = row.get("sum") or {}
+        avg = row.get("avg") or {}
+
+        data.update({
+            f"visits_{window}": sums.get("visits") or 0,
+            f"page_views_{window}": sums.get("pageViews") or 0,
+            f"page_load_{window}": avg.get("pageLoadTime"),
+        })
+    return data
@@ -14,6 +14,9 @@ from .const import (
 class CloudflareStatisticsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(self, user_input=None):
         if user_input is not None:
+            # One entry per zone, so the same zone is never polled twice
+            await self.async_set_unique_id(user_input[CONF_ZONE_ID])
+            self._abort_if_unique_id_configured()
             return self.async_create_entry(title="Cloudflare Statistics", data=user_input)
 
         schema = vol.Schema({
@@ -6,4 +6,14 @@ CONF_BANDWIDTH_UNIT = "bandwidth_unit"
 
 DEFAULT_SCAN_INTERVAL = 300
 DEFAULT_BANDWIDTH_UNIT = "MB"
-BANDWIDTH_UNITS = ["B", "KB", "MB", "GB"]
\ No newline at end of file
+BANDWIDTH_UNITS = ["B", "KB", "MB", "GB"]
+# Divisor from raw bytes to each bandwidth unit
+UNIT_FACTORS = {
+    "B": 1,
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+}
+
+# Sensor keys served by the optional country/web part of the GraphQL query
+COUNTRY_WEB_KEY_PREFIXES = ("country_", "page_", "visits")
\ No newline at end of file
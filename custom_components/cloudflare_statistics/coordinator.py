@@ -0,0 +1,58 @@
+from datetime import timedelta
+import logging
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .api import MIN_TIME_BETWEEN_UPDATES, CloudflareAPI
+from .const import (
+    BANDWIDTH_UNITS,
+    CONF_BANDWIDTH_UNIT,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_BANDWIDTH_UNIT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    UNIT_FACTORS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CloudflareCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
+    """Polls Cloudflare once per interval and shares the result with every sensor."""
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, api: CloudflareAPI) -> None:
+        scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=max(timedelta(seconds=scan_interval), MIN_TIME_BETWEEN_UPDATES),
+        )
+        self.api = api
+
+        bandwidth_unit = entry.data.get(CONF_BANDWIDTH_UNIT, DEFAULT_BANDWIDTH_UNIT)
+        bandwidth_unit = bandwidth_unit.upper() if isinstance(bandwidth_unit, str) else DEFAULT_BANDWIDTH_UNIT
+        self.bandwidth_unit = bandwidth_unit if bandwidth_unit in BANDWIDTH_UNITS else DEFAULT_BANDWIDTH_UNIT
+        # Factors are powers of two, so multiplying by the inverse is exact
+        self._bandwidth_scale = 1 / UNIT_FACTORS[self.bandwidth_unit]
+
+    @property
+    def country_web_supported(self) -> bool:
+        return self.api.country_web_supported
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        data = await self.api.async_fetch()
+
+        # Convert once per poll so the bandwidth sensors only read their key
+        scale = self._bandwidth_scale
+        for window in ("today", "week", "month"):
+            raw = data.get(f"bandwidth_{window}_bytes")
+            if raw is None or scale == 1:
+                data[f"bandwidth_{window}"] = raw
+            else:
+                data[f"bandwidth_{window}"] = round(raw * scale, 2)
+        return data